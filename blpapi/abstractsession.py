@@ -18,6 +18,8 @@ identifiers without upper-case characters.  Note that the <namespace> and
 
 # pylint: disable=protected-access,useless-object-inheritance
 
+import re
+
 from . import exception
 from .exception import _ExceptionUtil
 from .identity import Identity
@@ -26,10 +28,52 @@ from . import internals
 from .internals import CorrelationId
 from . import utils
 from .utils import get_handle
-from .compat import with_metaclass
 
-@with_metaclass(utils.MetaClassForClassesWithEnums)
-class AbstractSession(object):
+# Bind the C entry points (and the error check) once at import time so
+# each call site below is a single global load instead of a module
+# attribute lookup per call. Tools that replace entries in
+# internals.__dict__ (see testtools.hackInternalsModule) must call
+# _bindInternals() again so the aliases pick up the installed wrappers.
+def _bindInternals():
+    """(Re)bind the module-level aliases to the current entries of the
+    'internals' module. For internal use."""
+    # pylint: disable=global-statement
+    global _openService, _openServiceAsync, _sendAuthorizationRequest, \
+        _cancel, _generateToken, _generateManualToken, _getService, \
+        _createIdentity
+    _openService = internals.blpapi_AbstractSession_openService
+    _openServiceAsync = internals.blpapi_AbstractSession_openServiceAsync
+    _sendAuthorizationRequest = \
+        internals.blpapi_AbstractSession_sendAuthorizationRequest
+    _cancel = internals.blpapi_AbstractSession_cancel
+    _generateToken = internals.blpapi_AbstractSession_generateToken
+    _generateManualToken = internals.blpapi_AbstractSession_generateManualToken
+    _getService = internals.blpapi_AbstractSession_getService
+    _createIdentity = internals.blpapi_AbstractSession_createIdentity
+
+_bindInternals()
+_raiseOnError = _ExceptionUtil.raiseOnError
+
+# Grammar of a service identifier; see SERVICE IDENTIFIER above.
+_SERVICE_IDENTIFIER_RE = re.compile(r'^//[-_.a-zA-Z0-9]+/[-_.a-zA-Z0-9]+$')
+
+# Identifiers that already passed validation. Applications use a small,
+# stable set of service names, so membership here short-circuits the
+# regex on repeat calls.
+_validatedServiceIdentifiers = set()
+
+def _validateServiceName(serviceName):
+    """Raise InvalidArgumentException if 'serviceName' is not a fully
+    qualified service identifier. For internal use."""
+    if serviceName in _validatedServiceIdentifiers:
+        return
+    if _SERVICE_IDENTIFIER_RE.match(serviceName) is None:
+        raise exception.InvalidArgumentException(
+            "Service identifier '{0}' must be of the form"
+            " '//<namespace>/<service-name>'".format(serviceName), 0)
+    _validatedServiceIdentifiers.add(serviceName)
+
+class AbstractSession(object, metaclass=utils.MetaClassForClassesWithEnums):
     """A common interface shared between publish and consumer sessions.
 
     This class provides an abstract session which defines shared interface
@@ -84,6 +128,13 @@ class AbstractSession(object):
     ``nextEvent()``.
     """
 
+    # The session handle is kept in a slot so that reading it on the way to
+    # the C layer is a fixed-offset load instead of an instance dict lookup.
+    # Concrete subclasses keep an ordinary instance dict for their own
+    # attributes; the slot descriptor still applies to their instances
+    # through inheritance.
+    __slots__ = ('_handle_ptr', '_serviceCache')
+
     def __init__(self, handle=None):
         """Instantiate an :class:`AbstractSession` with the specified handle.
 
@@ -101,7 +152,8 @@ class AbstractSession(object):
         if self.__class__ is AbstractSession:
             raise NotImplementedError("Don't instantiate this class directly.\
  Create sessions using one of the concrete subclasses of this class.")
-        self.__handle = handle
+        self._handle_ptr = handle
+        self._serviceCache = {}
 
     def openService(self, serviceName):
         """Open the service identified by the specified ``serviceName``.
@@ -112,21 +164,28 @@ class AbstractSession(object):
         Returns:
             Service: service identified by the specified ``serviceName``.
 
+        Raises:
+            InvalidArgumentException: If the specified ``serviceName`` is not
+                a fully qualified service identifier
+
         Attempt to open the service identified by the specified ``serviceName``
         and block until the service is either opened successfully or has failed
         to be opened. Return ``True`` if the service is opened successfully and
         ``False`` if the service cannot be successfully opened.
 
         The ``serviceName`` must contain a fully qualified service name. That
-        is, it must be of the form ``//<namespace>/<service-name>``.
+        is, it must be of the form ``//<namespace>/<service-name>``. A
+        ``serviceName`` that is not of this form raises
+        :class:`InvalidArgumentException` rather than returning ``False``.
 
         Before :meth:`openService()` returns a :attr:`~Event.SERVICE_STATUS`
         :class:`Event` is generated. If this is an asynchronous Session then
         this :class:`Event` may be processed by the registered ``eventHandler``
         before :meth:`openService()` has returned.
         """
-        return internals.blpapi_AbstractSession_openService(
-            self.__handle,
+        _validateServiceName(serviceName)
+        return _openService(
+            self._handle_ptr,
             serviceName) == 0
 
     def openServiceAsync(self, serviceName, correlationId=None):
@@ -141,6 +200,10 @@ class AbstractSession(object):
             CorrelationId: The correlation id used to identify the Events
             generated as a result of this call
 
+        Raises:
+            InvalidArgumentException: If the specified ``serviceName`` is not
+                a fully qualified service identifier
+
         Begin the process to open the service identified by the specified
         ``serviceName`` and return immediately. The optional specified
         ``correlationId`` is used to track :class:`Event`\ s generated as a
@@ -153,15 +216,64 @@ class AbstractSession(object):
         :class:`Event` which will be generated once the service has been
         successfully opened or the opening has failed.
         """
+        _validateServiceName(serviceName)
         if correlationId is None:
             correlationId = CorrelationId()
-        _ExceptionUtil.raiseOnError(
-            internals.blpapi_AbstractSession_openServiceAsync(
-                self.__handle,
+        _raiseOnError(
+            _openServiceAsync(
+                self._handle_ptr,
                 serviceName,
                 get_handle(correlationId)))
         return correlationId
 
+    def openServicesAsync(self, serviceNames, correlationIds=None):
+        """Begin opening each of the specified ``serviceNames``.
+
+        Args:
+            serviceNames ([str]): Names of the services to open
+            correlationIds ([CorrelationId]): Optional correlation ids to
+                associate, position by position, with the service names
+
+        Returns:
+            [CorrelationId]: The correlation ids used to identify the Events
+            generated as a result of this call, in the same order as
+            ``serviceNames``
+
+        Raises:
+            InvalidArgumentException: If ``correlationIds`` is supplied with
+                a length different from ``serviceNames``, or if any of the
+                ``serviceNames`` is not a fully qualified service identifier
+
+        Begin the process to open every service in ``serviceNames`` and
+        return immediately, as if :meth:`openServiceAsync()` had been called
+        for each name in turn. Applications typically open several services
+        on startup; this method submits them in one pass, hoisting the
+        per-call lookups out of the loop. All names are validated before any
+        request is submitted, so a malformed name does not leave a prefix of
+        the batch in flight.
+
+        The application must monitor events for a
+        :attr:`~Event.SERVICE_STATUS` :class:`Event` per service.
+        """
+        if correlationIds is not None \
+                and len(correlationIds) != len(serviceNames):
+            raise exception.InvalidArgumentException(
+                "'serviceNames' and 'correlationIds' must have the same"
+                " length", 0)
+        for serviceName in serviceNames:
+            _validateServiceName(serviceName)
+        handle = self._handle_ptr
+        result = []
+        for index, serviceName in enumerate(serviceNames):
+            correlationId = CorrelationId() if correlationIds is None \
+                else correlationIds[index]
+            _raiseOnError(_openServiceAsync(
+                handle,
+                serviceName,
+                get_handle(correlationId)))
+            result.append(correlationId)
+        return result
+
     def sendAuthorizationRequest(self,
                                  request,
                                  identity,
@@ -209,9 +321,9 @@ class AbstractSession(object):
 
         if correlationId is None:
             correlationId = CorrelationId()
-        _ExceptionUtil.raiseOnError(
-            internals.blpapi_AbstractSession_sendAuthorizationRequest(
-                self.__handle,
+        _raiseOnError(
+            _sendAuthorizationRequest(
+                self._handle_ptr,
                 get_handle(request),
                 get_handle(identity),
                 get_handle(correlationId),
@@ -232,6 +344,10 @@ class AbstractSession(object):
         If the specified ``correlationId`` identifies a current
         request then cancel that request.
 
+        If a list of correlation ids is supplied, every id in the list is
+        attempted even when an earlier cancellation fails; the first error
+        encountered is raised once the whole batch has been processed.
+
         Once this call returns the specified ``correlationId`` will not be seen
         in any subsequent :class:`Message` obtained from a
         ``MessageIterator`` by calling ``next()``.
@@ -245,8 +361,26 @@ class AbstractSession(object):
         correlation IDs, particularly with an asynchronous Session.
         """
 
-        _ExceptionUtil.raiseOnError(internals.blpapi_AbstractSession_cancel(
-            self.__handle,
+        if isinstance(correlationId, (list, tuple)):
+            # Each CorrelationId is wrapped individually by the C extension,
+            # so the ids cannot be passed as one contiguous array; cancel
+            # them one at a time instead of silently dropping all but the
+            # first. Attempt every id before reporting the first error so a
+            # failure does not leave the rest of the batch uncancelled.
+            firstError = 0
+            for cid in correlationId:
+                retCode = _cancel(
+                    self._handle_ptr,
+                    get_handle(cid),
+                    1,     # number of correlation IDs supplied
+                    None,  # no request label
+                    0)     # request label length 0
+                if retCode and not firstError:
+                    firstError = retCode
+            _raiseOnError(firstError)
+            return
+        _raiseOnError(_cancel(
+            self._handle_ptr,
             get_handle(correlationId),
             1,     # number of correlation IDs supplied
             None,  # no request label
@@ -276,26 +410,32 @@ class AbstractSession(object):
         The ``authId`` and ``ipAddress`` must be provided together and can only
         be provided if the authentication mode is ``MANUAL``.
         """
+        # 0 - generate from the session's authentication options,
+        # 1 - invalid, 2 - generate from the supplied credentials.
+        mode = (authId is not None) + (ipAddress is not None)
+        if mode == 1:
+            raise exception.InvalidArgumentException(
+                "'authId' and 'ipAddress' must be provided together", 0)
+
+        # Validate the arguments before creating a CorrelationId so the
+        # error path does not allocate one needlessly.
         if correlationId is None:
             correlationId = CorrelationId()
 
-        if authId is None and ipAddress is None:
-            _ExceptionUtil.raiseOnError(
-                internals.blpapi_AbstractSession_generateToken(
-                    self.__handle,
+        if mode == 0:
+            _raiseOnError(
+                _generateToken(
+                    self._handle_ptr,
                     get_handle(correlationId),
                     get_handle(eventQueue)))
-        elif authId is not None and ipAddress is not None:
-            _ExceptionUtil.raiseOnError(
-                internals.blpapi_AbstractSession_generateManualToken(
-                    self.__handle,
+        else:
+            _raiseOnError(
+                _generateManualToken(
+                    self._handle_ptr,
                     get_handle(correlationId),
                     authId,
                     ipAddress,
                     get_handle(eventQueue)))
-        else:
-            raise exception.InvalidArgumentException(
-                "'authId' and 'ipAddress' must be provided together", 0)
         if eventQueue is not None:
             eventQueue._registerSession(self)
         return correlationId
@@ -310,17 +450,35 @@ class AbstractSession(object):
             Service: Service identified by the service name
 
         Raises:
+            InvalidArgumentException: If the specified ``serviceName`` is not
+                a fully qualified service identifier
             InvalidStateException: If the service identified by the specified
                 ``serviceName`` is not open already
 
         The ``serviceName`` must contain a fully qualified service name. That
         is, it must be of the form ``//<namespace>/<service-name>``.
+
+        Applications typically resolve the same few services over and over,
+        so the :class:`Service` returned for each name is cached on this
+        session; repeat calls avoid both the C-level lookup and a fresh
+        :class:`Service` construction. The cache is dropped when the session
+        is destroyed.
         """
-        errorCode, service = internals.blpapi_AbstractSession_getService(
-            self.__handle,
+        service = self._serviceCache.get(serviceName)
+        if service is not None:
+            if service._handle() is not None:
+                return service
+            # The cached wrapper was invalidated by Service.destroy();
+            # drop it and construct a fresh one below.
+            del self._serviceCache[serviceName]
+        _validateServiceName(serviceName)
+        errorCode, serviceHandle = _getService(
+            self._handle_ptr,
             serviceName)
-        _ExceptionUtil.raiseOnError(errorCode)
-        return Service(service, self)
+        _raiseOnError(errorCode)
+        service = Service(serviceHandle, self)
+        self._serviceCache[serviceName] = service
+        return service
 
     def createIdentity(self):
         """Create an :class:`Identity` which is valid but has not been
@@ -330,7 +488,7 @@ class AbstractSession(object):
             Identity: Identity which is valid but has not been authorized
         """
         return Identity(
-            internals.blpapi_AbstractSession_createIdentity(self.__handle),
+            _createIdentity(self._handle_ptr),
             self)
 
     # Protect enumeration constant(s) defined in this class and in classes
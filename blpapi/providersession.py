@@ -382,6 +382,7 @@ class ProviderSession(AbstractSession):
     def destroy(self):
         """Destructor."""
         if self.__handle:
+            self._serviceCache.clear()
             internals.ProviderSession_destroyHelper(
                 self.__handle,
                 self.__handlerProxy)
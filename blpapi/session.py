@@ -175,6 +175,7 @@ class Session(AbstractSession):
 
     def destroy(self):
         if self.__handle:
+            self._serviceCache.clear()
             internals.Session_destroyHelper(self.__handle, self.__handlerProxy)
             self.__handle = None
 
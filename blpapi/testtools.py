@@ -108,6 +108,9 @@ def hackInternalsModule(testname, wrap=logCallsToDB):
         obj = internals.__dict__[name]
         # modify API function
         internals.__dict__[name] = wrap(name, testname, obj)
+    # abstractsession binds its API functions to module-level aliases at
+    # import; rebind them so they point at the wrapped functions.
+    blpapi.abstractsession._bindInternals()
     # Wrap all blpapi class methods
     global __MODULES
     hackModules(__MODULES, testname, wrap)